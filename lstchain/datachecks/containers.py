@@ -112,11 +112,11 @@ class DL1DataCheckContainer(Container):
         """
 
         self.subrun_index = subrun_index
+        all_dragon_times = np.asarray(table['dragon_time'])
         # the elapsed time is between first and last event of the events in
         # table (we do not apply the mask here since we want to have all
         # events!)
-        self.elapsed_time = table['dragon_time'][len(table)-1] - \
-                            table['dragon_time'][0]
+        self.elapsed_time = all_dragon_times[-1] - all_dragon_times[0]
         self.num_events = mask.sum()
         self.num_cleaned_events = np.isfinite(table['intensity'][mask]).sum()
         self.ucts_trigger_type = \
@@ -135,8 +135,8 @@ class DL1DataCheckContainer(Container):
                               u.s, copy=False)
         ucts_time = u.Quantity(np.array(table['ucts_time'][mask][0::n_jump]),
                                u.s, copy=False)
-        dragon_time = u.Quantity(np.array(table['dragon_time'][mask][
-                                          0::n_jump]), u.s, copy=False)
+        dragon_time = u.Quantity(all_dragon_times[np.asarray(mask)][0::n_jump],
+                                 u.s, copy=False)
         # in case the resulting number of entries is <n_samples, we have to pad
         # the arrays, because hdf vector columns must have the same number of
         # elements in each row. We repeat the last value in the array
@@ -148,8 +148,7 @@ class DL1DataCheckContainer(Container):
 
         # for the delta_t histogram we do not apply the mask, we want to have
         # all events present in the original table:
-        delta_t = np.array(table['dragon_time'][1:]) - \
-                  np.array(table['dragon_time'][:-1])
+        delta_t = np.diff(all_dragon_times)
         counts, _, _, = plt.hist(delta_t*1.e3,
                                  bins=histogram_binnings.hist_delta_t)
         self.hist_delta_t = counts
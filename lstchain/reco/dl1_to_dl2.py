@@ -571,7 +571,7 @@ def get_expected_source_pos(data, data_type, config):
         if config.get('observation_mode') == 'wobble':
 
             if 'source_name' in config:
-                source_coord  = SkyCoord.from_name(config.get('source_name'))
+                source_coord  = utils.resolve_source_name(config.get('source_name'))
             else:
                 source_coord  = SkyCoord(config.get('source_ra'), config.get('source_dec'), frame="icrs", unit="deg")
      
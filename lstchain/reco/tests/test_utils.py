@@ -34,6 +34,12 @@ def test_radec_to_camera():
     np.testing.assert_allclose(pointing_pos_camera.x.to_value(), expected_source_pos_camera[0].to_value(), atol=0.1)
     np.testing.assert_allclose(pointing_pos_camera.y.to_value(), expected_source_pos_camera[1].to_value(), atol=0.1)
 
+def test_resolve_source_name():
+    crab = utils.resolve_source_name('Crab')
+    assert crab.separation(SkyCoord.from_name('Crab')).to_value(u.deg) < 1e-6
+    # repeated lookups are served from the cache
+    assert utils.resolve_source_name('Crab') is crab
+
 def test_reco_source_position_sky():
     cog_x = np.array([2, 1]) * u.m
     cog_y = np.array([-1, 1]) * u.m
@@ -12,6 +12,7 @@ Usage:
 """
 
 import logging
+from functools import lru_cache
 from warnings import warn
 
 import astropy.units as u
@@ -45,6 +46,7 @@ __all__ = [
     'predict_source_position_in_camera',
     'radec_to_camera',
     'reco_source_position_sky',
+    'resolve_source_name',
     'rotate',
     'sky_to_camera',
     'source_dx_dy',
@@ -81,6 +83,23 @@ def rotate(flat_object, degree=0, origin=(0, 0)):
     return res
 
 
+@lru_cache(maxsize=None)
+def resolve_source_name(source_name):
+    """
+    Resolve a source name into sky coordinates, caching the result so that
+    the name lookup service is only queried once per source and process
+
+    Parameters:
+    -----------
+    str source_name: Name of the source
+
+    Returns:
+    --------
+    `astropy.coordinates.SkyCoord`
+    """
+    return SkyCoord.from_name(source_name)
+
+
 def extract_source_position(data, observed_source_name, equivalent_focal_length = 28*u.m):
     """
     Extract source position from data
@@ -95,7 +114,7 @@ def extract_source_position(data, observed_source_name, equivalent_focal_length
     --------
     2D array of coordinates of the source in form [(x),(y)] in astropy.units.m
     """
-    observed_source = SkyCoord.from_name(observed_source_name)
+    observed_source = resolve_source_name(observed_source_name)
     obstime = pd.to_datetime(data['dragon_time'], unit='s')
     pointing_alt = u.Quantity(data['alt_tel'], u.rad, copy=False)
     pointing_az = u.Quantity(data['az_tel'], u.rad, copy=False)
@@ -119,8 +138,8 @@ def compute_theta2(data, source_position, conversion_factor=2.0):
     -------
     Array with `theta2` values
     """
-    reco_src_x = np.array(data['reco_src_x']) * u.m
-    reco_src_y = np.array(data['reco_src_y']) * u.m
+    reco_src_x = u.Quantity(data['reco_src_x'], u.m, copy=False)
+    reco_src_y = u.Quantity(data['reco_src_y'], u.m, copy=False)
     return conversion_factor**2 * ((source_position[0] - reco_src_x)**2 +
                                    (source_position[1] - reco_src_y)**2)
 
@@ -233,7 +233,7 @@ def main():
                     dl1_container['disp_sign'] = disp_sign
 
                 for p in parameters_to_update:
-                    params[ii][p] = u.Quantity(dl1_container[p]).value
+                    params[ii][p] = u.Quantity(dl1_container[p], copy=False).value
 
             output.root[dl1_params_lstcam_key][:] = params
 